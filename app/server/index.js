@@ -5,6 +5,7 @@ import mammoth from 'mammoth';
 import pdfParse from 'pdf-parse/lib/pdf-parse.js';
 import TurndownService from 'turndown';
 import nlp from 'compromise';
+import { redactWithMap } from './redact.js';
 
 const app = express();
 const port = process.env.PORT || 3000;
@@ -19,32 +20,32 @@ app.use(express.static(publicDir));
 
 const turndown = new TurndownService();
 
-function normalizeNewlines(text) {
-  return text.replace(/\r\n?/g, '\n');
-}
+const LINE_BREAK_REGEX = /\r\n?|\n/;
+const EMAIL_REGEX = /[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}/gi;
 
 function chunkParagraphs(text) {
-  const lines = normalizeNewlines(text).split('\n');
+  const lines = text.split(LINE_BREAK_REGEX);
   const parts = [];
   let buffer = [];
   for (const line of lines) {
-    if (line.trim() === '') {
+    const trimmed = line.trim();
+    if (trimmed === '') {
       if (buffer.length) {
-        parts.push(buffer.join(' ').trim());
+        parts.push(buffer.join(' '));
         buffer = [];
       }
     } else {
-      buffer.push(line.trim());
+      buffer.push(trimmed);
     }
   }
-  if (buffer.length) parts.push(buffer.join(' ').trim());
+  if (buffer.length) parts.push(buffer.join(' '));
   return parts.join('\n\n');
 }
 
 function buildRedactionMapFromNER(text, userCompanyNames, userKeyPeople) {
   const doc = nlp(text);
-  const people = Array.from(new Set(doc.people().out('array')));
-  const orgs = Array.from(new Set(doc.organizations().out('array')));
+  const people = doc.people().out('array');
+  const orgs = doc.organizations().out('array');
 
   const explicitPeople = (userKeyPeople || []).filter(Boolean);
   const explicitOrgs = (userCompanyNames || []).filter(Boolean);
@@ -79,22 +80,8 @@ function buildRedactionMapFromNER(text, userCompanyNames, userKeyPeople) {
   return redactionMap;
 }
 
-function redactWithMap(text, redactionMap) {
-  let result = text;
-  // Sort by length desc to avoid partial overlaps
-  const entries = Array.from(redactionMap.entries()).sort((a, b) => b[0].length - a[0].length);
-  for (const [target, token] of entries) {
-    if (!target) continue;
-    const escaped = target.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-    const pattern = new RegExp(`(?<![\w-])${escaped}(?![\w-])`, 'gi');
-    result = result.replace(pattern, token);
-  }
-  return result;
-}
-
 function redactEmails(text) {
-  const emailRegex = /[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}/gi;
-  return text.replace(emailRegex, '[REDACTED_EMAIL]');
+  return text.replace(EMAIL_REGEX, '[REDACTED_EMAIL]');
 }
 
 function anonymize(text, options = {}) {
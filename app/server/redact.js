@@ -0,0 +1,32 @@
+const REGEX_SPECIAL_CHARS = /[.*+?^${}()|[\]\\]/g;
+
+// V8 caps a single RegExp at 32767 capture groups
+const MAX_TARGETS_PER_PATTERN = 10000;
+
+function redactBatch(text, entries) {
+  const tokens = entries.map(([, token]) => token);
+  const alternation = entries.map(([target]) => `(${target.replace(REGEX_SPECIAL_CHARS, '\\$&')})`).join('|');
+  const pattern = new RegExp(`(?<![\\w-])(?:${alternation})(?![\\w-])`, 'gi');
+  return text.replace(pattern, function (match) {
+    // The capture group that matched identifies the target, whatever its case
+    for (let i = 1; i <= tokens.length; i++) {
+      if (arguments[i] !== undefined) return tokens[i - 1];
+    }
+    return match;
+  });
+}
+
+export function redactWithMap(text, redactionMap) {
+  // Targets are scanned in batches, longest first. Within a batch, where two targets
+  // overlap, the one starting leftmost wins, and among targets starting at the same
+  // position the longest wins
+  const entries = Array.from(redactionMap.entries())
+    .filter(([target]) => target)
+    .sort((a, b) => b[0].length - a[0].length);
+
+  let result = text;
+  for (let start = 0; start < entries.length; start += MAX_TARGETS_PER_PATTERN) {
+    result = redactBatch(result, entries.slice(start, start + MAX_TARGETS_PER_PATTERN));
+  }
+  return result;
+}
@@ -0,0 +1,24 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { redactWithMap } from './redact.js';
+
+test('leftmost overlapping target wins', () => {
+  const map = new Map([['Jane Doe', '[PERSON_1]'], ['Doe Industries', '[ORG_1]']]);
+  assert.equal(redactWithMap('Jane Doe Industries', map), '[PERSON_1] Industries');
+});
+
+test('targets only match whole words', () => {
+  const map = new Map([['John', '[PERSON_1]']]);
+  assert.equal(redactWithMap('John and JOHN, not Johnson', map), '[PERSON_1] and [PERSON_1], not Johnson');
+});
+
+test('case variants the i flag matches resolve to the target token', () => {
+  assert.equal(redactWithMap('Σωκράτησ met', new Map([['Σωκράτης', '[PERSON_1]']])), '[PERSON_1] met');
+  assert.equal(redactWithMap('Μαρία here', new Map([['µαρία', '[PERSON_1]']])), '[PERSON_1] here');
+});
+
+test('maps larger than the V8 capture limit are redacted', () => {
+  const map = new Map();
+  for (let i = 0; i < 40000; i++) map.set(`name${i}`, `[PERSON_${i + 1}]`);
+  assert.equal(redactWithMap('name0 met name39999', map), '[PERSON_1] met [PERSON_40000]');
+});